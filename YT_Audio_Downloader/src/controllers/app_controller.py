@@ -102,20 +102,21 @@ class AppController:
         """
         Processes user-provided URLs and creates corresponding download tasks.
 
-        - Validates URL presence
+        - Validates URL presence, ignoring blank entries
         - Creates DownloadTask instances for each URL
         - Enqueues tasks in the DownloadManager
         - Shows error if no URLs are provided
         """
-        urls = self.view.get_urls()
+        urls = [url.strip() for url in self.view.get_urls() if url.strip()]
         if not urls:
             self.view.show_error(
                 "No URLs provided. Please enter at least one YouTube URL."
             )
             return
 
+        output_format = self.view.get_format()  # Read the widget once per submit
         for url in urls:
-            task = DownloadTask(url=url.strip(), output_format=self.view.get_format())
+            task = DownloadTask(url=url, output_format=output_format)
             self.model.enqueue_task(task)
 
     def run(self):
@@ -124,6 +125,10 @@ class AppController:
 
         - Starts the download processing system
         - Initializes and runs the main UI loop
+        - Stops the download workers once the UI loop exits
         """
         self.model.start_processing()
-        self.view.mainloop()
+        try:
+            self.view.mainloop()
+        finally:
+            self.model.shutdown()
@@ -9,15 +9,41 @@ Attributes:
     progress (float): Download progress percentage
     status (str): Current status of the download
     error (str): Error message if any occurred
+    title (str): Video title reported by yt-dlp once the download starts
+    display_name (str): Title if known, otherwise the last URL path segment
+
+Internal bookkeeping fields (excluded from __init__, repr and comparisons) cache
+values used by the download manager on the progress hot path.
 """
 
-from dataclasses import dataclass
+import os
+import sys
+from dataclasses import dataclass, field
+
+# Slotted instances (no per-task __dict__) need Python 3.10+;
+# 3.9 keeps a plain dataclass
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DownloadTask:
     url: str
     output_format: str
     progress: float = 0.0
     status: str = "Pending"
     error: str = None
+    title: str = None
+    _url_name: str = field(default=None, init=False, repr=False, compare=False)
+    _total_bytes: int = field(default=None, init=False, repr=False, compare=False)
+    _inv_total: float = field(default=0.0, init=False, repr=False, compare=False)
+    _notified_percent: int = field(
+        default=-1, init=False, repr=False, compare=False
+    )
+    _notified_status: str = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._url_name = os.path.basename(self.url)  # Computed once per task
+
+    @property
+    def display_name(self):
+        return self.title or self._url_name
@@ -1,17 +1,15 @@
 # YT_Audio_Downloader\src\services\ffmpeg_service.py
-import subprocess
+import functools
+import shutil
 
 
 class FFmpegService:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_path():
+        # PATH lookup only, resolved once per process
+        return shutil.which("ffmpeg")
+
     @staticmethod
     def check_availability():
-        try:
-            subprocess.run(
-                ["ffmpeg", "-version"],
-                check=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-            return True
-        except (FileNotFoundError, subprocess.CalledProcessError):
-            return False
+        return FFmpegService.get_path() is not None
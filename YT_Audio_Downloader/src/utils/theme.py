@@ -1,8 +1,34 @@
 # YT_Audio_Downloader\src\utils\theme.py
 import customtkinter as ctk
-import os
 import sys
-from PIL import Image, ImageTk
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from PIL import ImageTk
+from .window_utils import WindowUtils
+
+
+def _resolve_theme_path():
+    """
+    Locates the theme.json file.
+
+    Returns:
+        str or None: The path to the theme.json file if found, None otherwise.
+
+    Note:
+        The function checks both the regular file system path and
+        PyInstaller's temporary directory when running as a frozen application.
+    """
+    paths_to_try = [Path(__file__).parent / "theme.json"]
+    if getattr(sys, "frozen", False):
+        paths_to_try.append(Path(sys._MEIPASS) / "theme.json")
+
+    for path in paths_to_try:
+        if path.exists():
+            return str(path)
+    return None
+
+
+_THEME_PATH = _resolve_theme_path()
 
 
 class ProfessionalTheme:
@@ -50,29 +76,41 @@ class ProfessionalTheme:
             str or None: The path to the theme.json file if found, None otherwise.
 
         Note:
-            The method checks both the regular file system path and
-            PyInstaller's temporary directory when running as a frozen application.
+            The path is resolved once at import time by _resolve_theme_path().
         """
-        base_path = os.path.dirname(__file__)
-        paths_to_try = [
-            os.path.join(base_path, "theme.json"),
-            (
-                os.path.join(sys._MEIPASS, "theme.json")
-                if getattr(sys, "frozen", False)
-                else None
-            ),
-        ]
+        return _THEME_PATH
 
-        for path in paths_to_try:
-            if path and os.path.exists(path):
-                return path
-        return None
+    @classmethod
+    def preload_icons(cls, icon_names, size=(24, 24)):
+        """
+        Decodes icons on background threads so later get_icon() calls on the
+        UI thread only have to wrap the cached image in a PhotoImage.
+
+        Args:
+            icon_names (iterable): The names of the icon files without extension
+            size (tuple): The desired size of the icons as (width, height)
+
+        Returns:
+            list: The futures of the preload jobs; this method does not block.
+        """
+        size = tuple(size)
+        executor = ThreadPoolExecutor(thread_name_prefix="icon-preload")
+        futures = [
+            executor.submit(WindowUtils.load_image, icon_path, size)
+            for icon_path in map(WindowUtils.get_icon_path, icon_names)
+            if icon_path is not None
+        ]
+        executor.shutdown(wait=False)  # Let the jobs finish in the background
+        return futures
 
     @classmethod
     def get_icon(cls, icon_name, size=(24, 24)):
         """
         Loads and returns an icon from the resources directory.
 
+        Decoded icons are cached (see preload_icons()), so repeated calls only
+        create the PhotoImage.
+
         Args:
             icon_name (str): The name of the icon file without extension
             size (tuple): The desired size of the icon as (width, height)
@@ -81,10 +119,10 @@ class ProfessionalTheme:
             ImageTk.PhotoImage or None: The loaded and resized icon, or None if loading fails
         """
         try:
-            icon_path = os.path.join(
-                os.path.dirname(__file__), "icons", f"{icon_name}.png"
-            )
-            return ImageTk.PhotoImage(Image.open(icon_path).resize(size))
+            icon_path = WindowUtils.get_icon_path(icon_name)
+            if icon_path is None:
+                return None
+            return ImageTk.PhotoImage(WindowUtils.load_image(icon_path, tuple(size)))
         except Exception as e:
             print(f"Error loading icon {icon_name}: {e}")
             return None
@@ -17,12 +17,72 @@ Dependencies:
 - pathlib for cross-platform path handling
 """
 
+import functools
 import os
 import sys
+import uuid
 from pathlib import Path
 from PIL import Image, ImageTk
 import ctypes
-from ctypes import windll
+
+if sys.platform == "win32":
+    from ctypes import wintypes
+
+    class _GUID(ctypes.Structure):
+        """Windows GUID structure used by the Known Folder API."""
+
+        _fields_ = [
+            ("Data1", wintypes.DWORD),
+            ("Data2", wintypes.WORD),
+            ("Data3", wintypes.WORD),
+            ("Data4", ctypes.c_ubyte * 8),
+        ]
+
+        @classmethod
+        def from_string(cls, guid_string):
+            value = uuid.UUID(guid_string)
+            return cls(
+                value.time_low,
+                value.time_mid,
+                value.time_hi_version,
+                (ctypes.c_ubyte * 8)(*value.bytes[8:]),
+            )
+
+    _FOLDERID_DOWNLOADS = _GUID.from_string("{374DE290-123F-4565-9164-39C4925E467B}")
+
+    # Function prototypes are bound once so calls skip ctypes argument inference
+    _SHGetKnownFolderPath = ctypes.windll.shell32.SHGetKnownFolderPath
+    _SHGetKnownFolderPath.argtypes = [
+        ctypes.POINTER(_GUID),
+        wintypes.DWORD,
+        wintypes.HANDLE,
+        ctypes.POINTER(ctypes.c_wchar_p),
+    ]
+    _SHGetKnownFolderPath.restype = ctypes.c_long
+
+    _CoTaskMemFree = ctypes.windll.ole32.CoTaskMemFree
+    _CoTaskMemFree.argtypes = [ctypes.c_void_p]
+    _CoTaskMemFree.restype = None
+
+    _GetParent = ctypes.windll.user32.GetParent
+    _GetParent.argtypes = [wintypes.HWND]
+    _GetParent.restype = wintypes.HWND
+
+    try:
+        _DwmSetWindowAttribute = ctypes.WinDLL("dwmapi").DwmSetWindowAttribute
+        _DwmSetWindowAttribute.argtypes = [
+            wintypes.HWND,
+            wintypes.DWORD,
+            ctypes.c_void_p,
+            wintypes.DWORD,
+        ]
+        _DwmSetWindowAttribute.restype = ctypes.c_long
+    except (OSError, AttributeError):
+        _DwmSetWindowAttribute = None  # Desktop Window Manager not available
+
+# Constants for Windows API
+DWMWA_USE_IMMERSIVE_DARK_MODE = 20
+DWMWA_MICA_EFFECT = 1029
 
 
 class WindowUtils:
@@ -86,38 +146,78 @@ class WindowUtils:
         window.geometry(f"+{x}+{y}")
 
     @staticmethod
-    def set_window_icon(window, icon_name="app_icon"):
+    def get_icon_path(icon_name="app_icon"):
         """
-        Sets the window icon from resources.
+        Resolves the path of an icon resource file.
 
-        This method attempts to set the window icon using a specified resource file.
         It supports both standard Python environments and frozen executables.
 
+        Args:
+            icon_name (str): Name of the icon resource file (default: "app_icon")
+
+        Returns:
+            str or None: Path to the icon PNG file, or None if it does not exist
+        """
+        # Attempt to use the standard path
+        icon_path = os.path.join(os.path.dirname(__file__), "icons", f"{icon_name}.png")
+
+        # If running in a frozen executable
+        if getattr(sys, "frozen", False) and not os.path.exists(icon_path):
+            icon_path = os.path.join(sys._MEIPASS, "icons", f"{icon_name}.png")
+
+        return icon_path if os.path.exists(icon_path) else None
+
+    @staticmethod
+    def set_window_icon(window, icon_name="app_icon", icon=None):
+        """
+        Sets the window icon from resources.
+
+        This method attempts to set the window icon using a specified resource file,
+        or a preloaded image so callers can reuse one PhotoImage for many windows.
+
         Args:
             window: Target window for icon application
             icon_name (str): Name of the icon resource file (default: "app_icon")
+            icon (ImageTk.PhotoImage, optional): Preloaded icon to apply instead
 
         Returns:
             bool: True if the icon was successfully applied, False otherwise
         """
         try:
-            # Attempt to use the standard path
-            icon_path = os.path.join(
-                os.path.dirname(__file__), "icons", f"{icon_name}.png"
-            )
-
-            # If running in a frozen executable
-            if getattr(sys, "frozen", False) and not os.path.exists(icon_path):
-                icon_path = os.path.join(sys._MEIPASS, "icons", f"{icon_name}.png")
-
-            if os.path.exists(icon_path):
-                icon = ImageTk.PhotoImage(Image.open(icon_path))
-                window.iconphoto(True, icon)
-                return True
+            if icon is None:
+                icon_path = WindowUtils.get_icon_path(icon_name)
+                if icon_path is None:
+                    return False
+                icon = ImageTk.PhotoImage(WindowUtils.load_image(icon_path))
+            window.iconphoto(True, icon)
+            return True
         except Exception as e:
             print(f"Error setting the icon: {e}")
         return False
 
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def load_image(path, size=None):
+        """
+        Decodes an image file, optionally resizing it, and caches the result.
+
+        The decoded PIL image is cached rather than a PhotoImage, since
+        PhotoImages are bound to a Tk interpreter while PIL images can be
+        wrapped again for any window.
+
+        Args:
+            path (str): Path to the image file
+            size (tuple, optional): Desired size as (width, height)
+
+        Returns:
+            PIL.Image.Image: The decoded (and resized) image
+        """
+        image = Image.open(path)
+        if size is not None:
+            image = image.resize(size)
+        image.load()  # Force decoding so later uses never touch the file
+        return image
+
     @staticmethod
     def apply_window_blur(window):
         """
@@ -133,20 +233,14 @@ class WindowUtils:
             bool: True if the effect was successfully applied, False otherwise
         """
         try:
-            if sys.platform == "win32":
-                from ctypes import windll, c_int, byref, sizeof
-
-                # Constants for Windows API
-                DWMWA_USE_IMMERSIVE_DARK_MODE = 20
-                DWMWA_MICA_EFFECT = 1029
-
+            if sys.platform == "win32" and _DwmSetWindowAttribute is not None:
                 # Reference to the window
-                hwnd = windll.user32.GetParent(window.winfo_id())
+                hwnd = _GetParent(window.winfo_id())
 
                 # Attempt to apply Mica effect (Windows 11)
-                value = c_int(1)
-                windll.dwmapi.DwmSetWindowAttribute(
-                    hwnd, DWMWA_MICA_EFFECT, byref(value), sizeof(value)
+                value = ctypes.c_int(1)
+                _DwmSetWindowAttribute(
+                    hwnd, DWMWA_MICA_EFFECT, ctypes.byref(value), ctypes.sizeof(value)
                 )
                 return True
         except Exception:
@@ -154,24 +248,20 @@ class WindowUtils:
         return False
 
     @staticmethod
-    def create_rounded_rectangle(canvas, x1, y1, x2, y2, radius=20, **kwargs):
+    @functools.lru_cache(maxsize=32)
+    def _rounded_rectangle_points(x1, y1, x2, y2, radius):
         """
-        Creates a rounded rectangle shape on a canvas.
+        Computes the polygon control points of a rounded rectangle.
 
-        This method generates a custom UI element with rounded corners
-        on a given canvas.
-
-        Args:
-            canvas: Target canvas for shape creation
-            x1, y1 (int): Top-left coordinates
-            x2, y2 (int): Bottom-right coordinates
-            radius (int): Corner radius (default: 20)
-            **kwargs: Additional parameters for canvas drawing
+        Each corner contributes the corner point itself plus one point on each
+        adjacent edge, which the smoothed polygon turns into a rounded corner.
+        Results are cached per geometry since shapes are redrawn with the same
+        dimensions.
 
         Returns:
-            int: ID of the created shape
+            tuple: Flat sequence of the 12 (x, y) control points
         """
-        points = [
+        return (
             x1 + radius,
             y1,
             x2 - radius,
@@ -196,34 +286,55 @@ class WindowUtils:
             y1 + radius,
             x1,
             y1,
-        ]
+        )
+
+    @staticmethod
+    def create_rounded_rectangle(canvas, x1, y1, x2, y2, radius=20, **kwargs):
+        """
+        Creates a rounded rectangle shape on a canvas.
+
+        This method generates a custom UI element with rounded corners
+        on a given canvas.
+
+        Args:
+            canvas: Target canvas for shape creation
+            x1, y1 (int): Top-left coordinates
+            x2, y2 (int): Bottom-right coordinates
+            radius (int): Corner radius (default: 20)
+            **kwargs: Additional parameters for canvas drawing
+
+        Returns:
+            int: ID of the created shape
+        """
+        points = WindowUtils._rounded_rectangle_points(x1, y1, x2, y2, radius)
         return canvas.create_polygon(points, **kwargs, smooth=True)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_downloads_path() -> Path:
         """
         Determines the system's downloads directory path.
 
         This method resolves the path to the system's downloads directory
         in a cross-platform manner. It provides a fallback location if the
-        resolution fails.
+        resolution fails. The result is cached, so the system lookup and the
+        directory creation only happen on the first call.
 
         Returns:
             Path: Path to the downloads directory or fallback location
         """
         try:
             if sys.platform == "win32":
-                FOLDERID_Downloads = "{374DE290-123F-4565-9164-39C4925E467B}"
                 psz_path = ctypes.c_wchar_p()
-                hr = windll.shell32.SHGetKnownFolderPath(
-                    ctypes.create_unicode_buffer(FOLDERID_Downloads),
+                hr = _SHGetKnownFolderPath(
+                    ctypes.byref(_FOLDERID_DOWNLOADS),
                     0,
                     None,
                     ctypes.byref(psz_path),
                 )
                 if hr == 0:
-                    path = Path(ctypes.wstring_at(psz_path))
-                    windll.ole32.CoTaskMemFree(psz_path)
+                    path = Path(psz_path.value)
+                    _CoTaskMemFree(psz_path)
                 else:
                     path = Path.home() / "Downloads"
             else:
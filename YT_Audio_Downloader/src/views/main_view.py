@@ -20,14 +20,95 @@ download status updates in real-time.
 
 # YT_Audio_Downloader\src\views\main_view.py
 import customtkinter as ctk
-import tkinter as tk
+import re
+import time
 import webbrowser
-from datetime import datetime
-from PIL import Image, ImageTk
-import os
+from collections import deque
+from tkinter import TclError
 from models import DownloadObserver
 from utils import ProfessionalTheme, WindowUtils
 
+# Static dialog content, allocated once at import time
+_TERMS_TEXT = """\
+TERMS AND CONDITIONS OF USE
+
+1. USER RESPONSIBILITY
+
+This application is designed exclusively for downloading content that you own the rights to or are authorized to download. The user is fully responsible for the use of this tool.
+
+2. LEGAL USE
+
+You agree to use this application only for legal purposes and in accordance with copyright laws applicable in your jurisdiction. Downloading protected content without authorization may constitute a copyright violation.
+
+3. LIMITATION OF LIABILITY
+
+The developers of this application are not responsible for any misuse of this tool. This application is provided "as is," without any warranties.
+
+4. PRIVACY
+
+This application does not collect or store personal information from the user or activity logs on external servers.
+
+5. UPDATES
+
+Terms may be updated periodically. It is the user's responsibility to review these terms regularly.
+"""
+
+# Help dialog sections as (title, content) pairs
+_HELP_SECTIONS = (
+    (
+        "How to download audio",
+        "1. Paste one or more YouTube URLs\n2. Select the desired format\n3. Accept the legal terms\n4. Click 'Start Downloads'",
+    ),
+    (
+        "Available formats",
+        "• MP3 320kbps - High quality, larger size\n• MP3 192kbps - Good quality, medium size\n• WAV - Lossless quality, large size\n• M4A - Apple format, good quality\n• OGG - Free format, good quality",
+    ),
+    (
+        "Troubleshooting",
+        "• Ensure you have an internet connection\n• Verify that FFmpeg is installed\n• URLs must be valid YouTube links\n• Check the log for specific errors",
+    ),
+)
+
+# Shared font specs: name -> (family, size, weight, underline)
+_FONT_SPECS = {
+    "body10": ("Segoe UI", 10, "normal", False),
+    "link10": ("Segoe UI", 10, "normal", True),
+    "body11": ("Segoe UI", 11, "normal", False),
+    "link11": ("Segoe UI", 11, "normal", True),
+    "body12": ("Segoe UI", 12, "normal", False),
+    "bold12": ("Segoe UI", 12, "bold", False),
+    "bold14": ("Segoe UI", 14, "bold", False),
+    "bold16": ("Segoe UI", 16, "bold", False),
+    "bold18": ("Segoe UI", 18, "bold", False),
+    "icon36": ("Segoe UI", 36, "normal", False),
+    "mono11": ("Consolas", 11, "normal", False),
+    "mono12": ("Consolas", 12, "normal", False),
+}
+_FONTS = None
+
+
+def _get_fonts():
+    """
+    Returns the shared CTkFont instances, creating them on first use.
+
+    Fonts need an existing Tk root, so this must be called after the main
+    window is created. Widgets sharing one CTkFont share one Tk font resource.
+    """
+    global _FONTS
+    if _FONTS is None:
+        _FONTS = {
+            name: ctk.CTkFont(
+                family=family, size=size, weight=weight, underline=underline
+            )
+            for name, (family, size, weight, underline) in _FONT_SPECS.items()
+        }
+    return _FONTS
+
+
+# A non-blank line without its surrounding whitespace (one URL per line);
+# \n, \r\n and bare \r all end a line, as with str.splitlines()
+_URL_LINE_RE = re.compile(r"\S[^\r\n]*\S|\S")
+
 
 class MainView(ctk.CTk, DownloadObserver):
     """
@@ -42,6 +123,26 @@ class MainView(ctk.CTk, DownloadObserver):
     - Legal compliance controls
     """
 
+    # Maximum number of log entries kept while waiting for the next flush
+    LOG_BUFFER_SIZE = 2000
+    # Maximum number of lines kept in the activity log display
+    LOG_MAX_LINES = 5000
+    # Minimum delay between progress redraws (~30 Hz)
+    PROGRESS_UI_INTERVAL_MS = 33
+
+    # Format selector labels mapped to yt-dlp audio codecs
+    _FORMAT_MAP = {
+        "MP3 320kbps": "mp3",
+        "MP3 192kbps": "mp3",
+        "WAV": "wav",
+        "M4A": "m4a",
+        "OGG": "vorbis",
+    }
+    _FORMAT_VALUES = tuple(_FORMAT_MAP)
+
+    # Application icon, decoded once and shared by every window
+    _icon_image = None
+
     def __init__(self, controller):
         """
         Initialize the main window and set up all UI components.
@@ -50,11 +151,27 @@ class MainView(ctk.CTk, DownloadObserver):
             controller: Reference to the application controller
         """
         super().__init__()
+        self._fonts = _get_fonts()  # Needs the Tk root created above
 
         # Main attributes
         self.controller = controller
         self.current_task = None
         self.legal_checkbox_var = ctk.BooleanVar(value=False)
+        self._log_buffer = deque(maxlen=self.LOG_BUFFER_SIZE)
+        self._log_flush_scheduled = False
+        self._log_line_count = 0  # Lines currently shown in the activity log
+        self._pending_task = None  # Latest task waiting for a progress redraw
+        self._ui_flush_id = None
+        self._shown_percent = None  # Percentage currently shown in the label
+        self._last_progress_color_status = None  # Status the bar color reflects
+        self._url_cache = None  # URLs parsed from the unmodified input field
+        # Dialogs are built on first use and hidden instead of destroyed
+        self._disclaimer_dialog = None
+        self._help_dialog = None
+        self._warning_dialog = None
+        self._error_dialog = None
+        self.log_frame = None  # Built after the first paint
+        self._closed = False  # Set by destroy(); stops callbacks from other threads
 
         # Initial configurations
         ProfessionalTheme.apply()
@@ -67,10 +184,30 @@ class MainView(ctk.CTk, DownloadObserver):
         WindowUtils.center(self, width_percentage=65, height_percentage=70)
 
         # Load application icon
-        WindowUtils.set_window_icon(self)
+        WindowUtils.set_window_icon(self, icon=self._get_icon())
 
-        # Show initial disclaimer
-        self._show_disclaimer()
+        # Build the remaining sections and the disclaimer once the window is shown
+        self.after_idle(self._create_deferred_widgets)
+
+    @classmethod
+    def _get_icon(cls):
+        """
+        Returns the application icon, loading it on first use.
+
+        Requires an existing Tk root. Returns None if the icon is unavailable.
+        """
+        if cls._icon_image is None:
+            icon_path = WindowUtils.get_icon_path()
+            if icon_path is not None:
+                from PIL import ImageTk  # Only needed once an icon is loaded
+
+                try:
+                    cls._icon_image = ImageTk.PhotoImage(
+                        WindowUtils.load_image(icon_path)
+                    )
+                except Exception as e:
+                    print(f"Error loading the icon: {e}")
+        return cls._icon_image
 
     def _configure_window(self):
         """Configure the main window properties and appearance"""
@@ -82,7 +219,7 @@ class MainView(ctk.CTk, DownloadObserver):
         WindowUtils.apply_window_blur(self)
 
     def _create_widgets(self):
-        """Create all UI widgets with their initial properties"""
+        """Create the UI widgets needed for the first paint"""
         # Main frame with internal padding
         self.main_frame = ctk.CTkFrame(self)
 
@@ -98,22 +235,39 @@ class MainView(ctk.CTk, DownloadObserver):
         # Current progress section
         self.progress_frame = self._create_progress_frame()
 
+    def _create_deferred_widgets(self):
+        """
+        Create the sections that are not needed for the first paint.
+
+        Runs from the event loop after the main window has been drawn, then
+        writes any log entries queued meanwhile and shows the disclaimer.
+        """
         # Log section
         self.log_frame = self._create_log_frame()
+        self.log_frame.pack(fill="both", expand=True, pady=5)
 
         # Footer with legal information and links
         self.footer_frame = self._create_footer_frame()
+        self.footer_frame.pack(fill="x", pady=(5, 0))
+
+        if self._log_buffer:
+            self._flush_log()
+
+        # Show initial disclaimer
+        self.after(200, self._show_disclaimer)
 
     def _create_header_frame(self):
         """Create top bar with logo and information"""
+        colors = ProfessionalTheme.COLORS
+
         frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
 
         # Logo (stylized text)
         logo_label = ctk.CTkLabel(
             frame,
             text="🎵 Audio Downloader Pro",
-            font=("Segoe UI", 18, "bold"),
-            text_color=ProfessionalTheme.COLORS["accent"],
+            font=self._fonts["bold18"],
+            text_color=colors["accent"],
         )
         logo_label.pack(side="left", padx=5)
 
@@ -124,7 +278,7 @@ class MainView(ctk.CTk, DownloadObserver):
             width=30,
             height=30,
             corner_radius=15,
-            font=("Segoe UI", 14, "bold"),
+            font=self._fonts["bold14"],
             command=self._show_help,
         )
         help_btn.pack(side="right", padx=5)
@@ -133,20 +287,22 @@ class MainView(ctk.CTk, DownloadObserver):
 
     def _create_input_frame(self):
         """Create URL input section"""
+        colors = ProfessionalTheme.COLORS
+
         frame = ctk.CTkFrame(self.main_frame)
 
         # Instructions label
         input_label = ctk.CTkLabel(
             frame,
             text="Enter YouTube URLs (one per line):",
-            font=("Segoe UI", 12, "bold"),
+            font=self._fonts["bold12"],
             anchor="w",
         )
         input_label.pack(fill="x", padx=10, pady=(10, 5))
 
         # URL input field
         self.url_input = ctk.CTkTextbox(
-            frame, height=100, wrap="word", font=("Consolas", 12)
+            frame, height=100, wrap="word", font=self._fonts["mono12"]
         )
         self.url_input.pack(fill="x", padx=10, pady=5)
 
@@ -154,8 +310,8 @@ class MainView(ctk.CTk, DownloadObserver):
         example_label = ctk.CTkLabel(
             frame,
             text="Example: https://www.youtube.com/watch?v=dQw4w9WgXcQ",
-            font=("Segoe UI", 10),
-            text_color=ProfessionalTheme.COLORS["text_muted"],
+            font=self._fonts["body10"],
+            text_color=colors["text_muted"],
             anchor="w",
         )
         example_label.pack(fill="x", padx=10, pady=(0, 10))
@@ -172,24 +328,24 @@ class MainView(ctk.CTk, DownloadObserver):
 
         # Format selector with label
         format_label = ctk.CTkLabel(
-            inner_frame, text="Format:", font=("Segoe UI", 12), width=70
+            inner_frame, text="Format:", font=self._fonts["body12"], width=70
         )
         format_label.pack(side="left", padx=(5, 0))
 
         self.format_selector = ctk.CTkOptionMenu(
             inner_frame,
-            values=["MP3 320kbps", "MP3 192kbps", "WAV", "M4A", "OGG"],
-            font=("Segoe UI", 12),
+            values=list(self._FORMAT_VALUES),
+            font=self._fonts["body12"],
             width=150,
         )
         self.format_selector.pack(side="left", padx=10)
-        self.format_selector.set("MP3 320kbps")
+        self.format_selector.set(self._FORMAT_VALUES[0])
 
         # Download button
         self.download_btn = ctk.CTkButton(
             inner_frame,
             text="Start Downloads",
-            font=("Segoe UI", 12, "bold"),
+            font=self._fonts["bold12"],
             command=self.controller.start_downloads,
             width=200,
             height=35,
@@ -202,7 +358,7 @@ class MainView(ctk.CTk, DownloadObserver):
             inner_frame,
             text="I accept legal terms",
             variable=self.legal_checkbox_var,
-            font=("Segoe UI", 11),
+            font=self._fonts["body11"],
             checkbox_width=20,
             checkbox_height=20,
         )
@@ -222,7 +378,7 @@ class MainView(ctk.CTk, DownloadObserver):
         self.status_label = ctk.CTkLabel(
             inner_frame,
             text="Status: Ready to download",
-            font=("Segoe UI", 11),
+            font=self._fonts["body11"],
             anchor="w",
         )
         self.status_label.pack(fill="x", pady=(0, 5))
@@ -239,7 +395,7 @@ class MainView(ctk.CTk, DownloadObserver):
 
         # Numeric percentage
         self.progress_percent = ctk.CTkLabel(
-            progress_container, text="0%", font=("Segoe UI", 11), width=40
+            progress_container, text="0%", font=self._fonts["body11"], width=40
         )
         self.progress_percent.pack(side="right")
 
@@ -253,14 +409,14 @@ class MainView(ctk.CTk, DownloadObserver):
         log_label = ctk.CTkLabel(
             frame,
             text="Activity Log:",
-            font=("Segoe UI", 12, "bold"),
+            font=self._fonts["bold12"],
             anchor="w",
         )
         log_label.pack(fill="x", padx=10, pady=(10, 5))
 
         # Log text field
         self.log_display = ctk.CTkTextbox(
-            frame, state="disabled", wrap="word", font=("Consolas", 11)
+            frame, state="disabled", wrap="word", font=self._fonts["mono11"]
         )
         self.log_display.pack(fill="both", expand=True, padx=10, pady=(0, 10))
 
@@ -268,14 +424,16 @@ class MainView(ctk.CTk, DownloadObserver):
 
     def _create_footer_frame(self):
         """Create footer with legal information and links"""
+        colors = ProfessionalTheme.COLORS
+
         frame = ctk.CTkFrame(self.main_frame, fg_color="transparent", height=30)
 
         # Version information
         version_label = ctk.CTkLabel(
             frame,
             text="v1.0.0",
-            font=("Segoe UI", 10),
-            text_color=ProfessionalTheme.COLORS["text_muted"],
+            font=self._fonts["body10"],
+            text_color=colors["text_muted"],
         )
         version_label.pack(side="right", padx=10)
 
@@ -283,8 +441,8 @@ class MainView(ctk.CTk, DownloadObserver):
         terms_link = ctk.CTkLabel(
             frame,
             text="Terms and Conditions",
-            font=("Segoe UI", 10, "underline"),
-            text_color=ProfessionalTheme.COLORS["accent"],
+            font=self._fonts["link10"],
+            text_color=colors["accent"],
             cursor="hand2",
         )
         terms_link.pack(side="left", padx=10)
@@ -302,28 +460,54 @@ class MainView(ctk.CTk, DownloadObserver):
         self.input_frame.pack(fill="x", pady=5)
         self.controls_frame.pack(fill="x", pady=5)
         self.progress_frame.pack(fill="x", pady=5)
-        self.log_frame.pack(fill="both", expand=True, pady=5)
-        self.footer_frame.pack(fill="x", pady=(5, 0))
+        # The log and footer are packed by _create_deferred_widgets
 
     def _configure_styles(self):
         """Configure additional styles and visual details"""
-        # Specific font configurations
-        self.url_input.configure(font=("Consolas", 12))
-        self.log_display.configure(font=("Consolas", 11))
-
         # Add initial message to the log
         self._append_log("✨ Application started. Ready to download.")
 
-    def _show_disclaimer(self):
-        """Displays the terms and conditions dialog"""
+    def _create_dialog(self, title, geometry):
+        """
+        Creates a hidden modal dialog that is reused across invocations.
+
+        Closing the dialog only hides it, so later calls can show it again
+        without rebuilding its widgets.
+        """
         dialog = ctk.CTkToplevel(self)
-        dialog.title("Terms and Conditions")
-        dialog.geometry("600x400")
+        dialog.withdraw()
+        dialog.title(title)
+        dialog.geometry(geometry)
         dialog.resizable(False, False)
-
-        # Block interaction with the main window
-        dialog.grab_set()
         dialog.transient(self)
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(dialog))
+        icon = self._get_icon()
+        if icon is not None:
+            dialog.iconphoto(False, icon)
+        return dialog
+
+    def _present_dialog(self, dialog):
+        """Shows a reusable dialog and blocks interaction with the main window"""
+        dialog.deiconify()
+        dialog.grab_set()
+        WindowUtils.center(dialog)
+
+    def _hide_dialog(self, dialog):
+        """Hides a reusable dialog and releases its input grab"""
+        dialog.grab_release()
+        dialog.withdraw()
+
+    def _show_disclaimer(self):
+        """Displays the terms and conditions dialog"""
+        if self._disclaimer_dialog is None:
+            self._disclaimer_dialog = self._build_disclaimer_dialog()
+        self._present_dialog(self._disclaimer_dialog)
+
+    def _build_disclaimer_dialog(self):
+        """Builds the terms and conditions dialog"""
+        colors = ProfessionalTheme.COLORS
+
+        dialog = self._create_dialog("Terms and Conditions", "600x400")
 
         # Main frame with improved design
         main_frame = ctk.CTkFrame(dialog)
@@ -333,47 +517,18 @@ class MainView(ctk.CTk, DownloadObserver):
         header = ctk.CTkLabel(
             main_frame,
             text="Terms and Conditions of Use",
-            font=("Segoe UI", 16, "bold"),
-            text_color=ProfessionalTheme.COLORS["accent"],
+            font=self._fonts["bold16"],
+            text_color=colors["accent"],
         )
         header.pack(pady=(10, 20))
 
-        # Terms content in scrollable frame
-        terms_frame = ctk.CTkScrollableFrame(main_frame, height=250)
-        terms_frame.pack(fill="x", padx=10, pady=10)
-
-        terms_text = """
-        TERMS AND CONDITIONS OF USE
-        
-        1. USER RESPONSIBILITY
-        
-        This application is designed exclusively for downloading content that you own the rights to or are authorized to download. The user is fully responsible for the use of this tool.
-        
-        2. LEGAL USE
-        
-        You agree to use this application only for legal purposes and in accordance with copyright laws applicable in your jurisdiction. Downloading protected content without authorization may constitute a copyright violation.
-        
-        3. LIMITATION OF LIABILITY
-        
-        The developers of this application are not responsible for any misuse of this tool. This application is provided "as is," without any warranties.
-        
-        4. PRIVACY
-        
-        This application does not collect or store personal information from the user or activity logs on external servers.
-        
-        5. UPDATES
-        
-        Terms may be updated periodically. It is the user's responsibility to review these terms regularly.
-        """
-
-        terms_label = ctk.CTkLabel(
-            terms_frame,
-            text=terms_text,
-            font=("Segoe UI", 11),
-            justify="left",
-            wraplength=540,
+        # Terms content in a read-only textbox (native wrapping and scrolling)
+        terms_box = ctk.CTkTextbox(
+            main_frame, height=250, wrap="word", font=self._fonts["body11"]
         )
-        terms_label.pack(fill="both", padx=5, pady=5)
+        terms_box.insert("1.0", _TERMS_TEXT)
+        terms_box.configure(state="disabled")
+        terms_box.pack(fill="x", padx=10, pady=10)
 
         # Links
         links_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
@@ -383,8 +538,8 @@ class MainView(ctk.CTk, DownloadObserver):
         terms_link = ctk.CTkLabel(
             links_frame,
             text="📄 View Full Documentation",
-            text_color=ProfessionalTheme.COLORS["accent"],
-            font=("Segoe UI", 11, "underline"),
+            text_color=colors["accent"],
+            font=self._fonts["link11"],
             cursor="hand2",
         )
         terms_link.pack(side="left")
@@ -396,27 +551,30 @@ class MainView(ctk.CTk, DownloadObserver):
         accept_btn = ctk.CTkButton(
             main_frame,
             text="I Accept the Terms",
-            command=lambda: (self.legal_checkbox_var.set(True), dialog.destroy()),
-            fg_color=ProfessionalTheme.COLORS["success"],
+            command=lambda: (
+                self.legal_checkbox_var.set(True),
+                self._hide_dialog(dialog),
+            ),
+            fg_color=colors["success"],
             hover_color="#4BB280",
             width=200,
             height=35,
         )
         accept_btn.pack(pady=15)
 
-        # Center dialog
-        WindowUtils.center(dialog)
+        return dialog
 
     def _show_help(self):
         """Displays the help dialog"""
-        dialog = ctk.CTkToplevel(self)
-        dialog.title("Help")
-        dialog.geometry("500x350")
-        dialog.resizable(False, False)
+        if self._help_dialog is None:
+            self._help_dialog = self._build_help_dialog()
+        self._present_dialog(self._help_dialog)
 
-        # Block interaction with the main window
-        dialog.grab_set()
-        dialog.transient(self)
+    def _build_help_dialog(self):
+        """Builds the help dialog"""
+        colors = ProfessionalTheme.COLORS
+
+        dialog = self._create_dialog("Help", "500x350")
 
         # Main frame
         main_frame = ctk.CTkFrame(dialog)
@@ -426,75 +584,49 @@ class MainView(ctk.CTk, DownloadObserver):
         title = ctk.CTkLabel(
             main_frame,
             text="🔍 Quick Help",
-            font=("Segoe UI", 16, "bold"),
-            text_color=ProfessionalTheme.COLORS["accent"],
+            font=self._fonts["bold16"],
+            text_color=colors["accent"],
         )
         title.pack(pady=(10, 20))
 
-        # Help content
-        help_frame = ctk.CTkScrollableFrame(main_frame)
-        help_frame.pack(fill="both", expand=True, padx=10, pady=10)
-
-        help_sections = [
-            {
-                "title": "How to download audio",
-                "content": "1. Paste one or more YouTube URLs\n2. Select the desired format\n3. Accept the legal terms\n4. Click 'Start Downloads'",
-            },
-            {
-                "title": "Available formats",
-                "content": "• MP3 320kbps - High quality, larger size\n• MP3 192kbps - Good quality, medium size\n• WAV - Lossless quality, large size\n• M4A - Apple format, good quality\n• OGG - Free format, good quality",
-            },
-            {
-                "title": "Troubleshooting",
-                "content": "• Ensure you have an internet connection\n• Verify that FFmpeg is installed\n• URLs must be valid YouTube links\n• Check the log for specific errors",
-            },
-        ]
-
-        for i, section in enumerate(help_sections):
-            # Section title
-            section_title = ctk.CTkLabel(
-                help_frame,
-                text=section["title"],
-                font=("Segoe UI", 12, "bold"),
-                text_color=ProfessionalTheme.COLORS["accent"],
-                anchor="w",
-            )
-            section_title.pack(fill="x", padx=5, pady=(10 if i > 0 else 0, 5))
-
-            # Section content
-            section_content = ctk.CTkLabel(
-                help_frame,
-                text=section["content"],
-                font=("Segoe UI", 11),
-                justify="left",
-                anchor="w",
-                wraplength=450,
-            )
-            section_content.pack(fill="x", padx=15, pady=5)
+        # Help content in a read-only textbox (native wrapping and scrolling)
+        help_box = ctk.CTkTextbox(main_frame, wrap="word", font=self._fonts["body11"])
+        # CTkTextbox forbids per-tag fonts, so titles are set apart by color
+        help_box.tag_config("title", foreground=colors["accent"], spacing1=10)
+        help_box.tag_config("content", lmargin1=10, lmargin2=10, spacing3=5)
+
+        for title_text, content_text in _HELP_SECTIONS:
+            help_box.insert("end", f"{title_text}\n", "title")
+            help_box.insert("end", f"{content_text}\n", "content")
+
+        help_box.configure(state="disabled")
+        help_box.pack(fill="both", expand=True, padx=10, pady=10)
 
         # Close button
         close_btn = ctk.CTkButton(
             main_frame,
             text="Close",
-            command=dialog.destroy,
+            command=lambda: self._hide_dialog(dialog),
             width=120,
             height=32,
         )
         close_btn.pack(pady=15)
 
-        # Center dialog
-        WindowUtils.center(dialog)
+        return dialog
 
     def show_warning(self, title, message):
         """Displays a warning to the user"""
-        dialog = ctk.CTkToplevel(self)
-        dialog.title(title)
-        dialog.geometry("400x200")
-        dialog.resizable(False, False)
+        if self._warning_dialog is None:
+            self._warning_dialog = self._build_warning_dialog()
+        self._warning_dialog.title(title)
+        self._warning_message.configure(text=message)
+        self._present_dialog(self._warning_dialog)
 
-        # Block interaction with the main window
-        dialog.grab_set()
-        dialog.transient(self)
+    def _build_warning_dialog(self):
+        """Builds the warning dialog; its title and message are set on show"""
+        colors = ProfessionalTheme.COLORS
+
+        dialog = self._create_dialog("Warning", "400x200")
 
         # Main frame
         main_frame = ctk.CTkFrame(dialog)
@@ -504,44 +636,49 @@ class MainView(ctk.CTk, DownloadObserver):
         warning_label = ctk.CTkLabel(
             main_frame,
             text="⚠️",
-            font=("Segoe UI", 36),
-            text_color=ProfessionalTheme.COLORS["warning"],
+            font=self._fonts["icon36"],
+            text_color=colors["warning"],
         )
         warning_label.pack(pady=(10, 5))
 
         # Message
-        message_label = ctk.CTkLabel(
+        self._warning_message = ctk.CTkLabel(
             main_frame,
-            text=message,
-            font=("Segoe UI", 12),
+            text="",
+            font=self._fonts["body12"],
             wraplength=350,
             justify="center",
         )
-        message_label.pack(pady=15, padx=10)
+        self._warning_message.pack(pady=15, padx=10)
 
         # Accept button
         ok_btn = ctk.CTkButton(
             main_frame,
             text="Understood",
-            command=dialog.destroy,
+            command=lambda: self._hide_dialog(dialog),
             width=120,
             height=32,
         )
         ok_btn.pack(pady=10)
 
-        # Center dialog
-        WindowUtils.center(dialog)
+        return dialog
 
     def show_error(self, message, title="Error"):
         """Displays an error message to the user"""
-        dialog = ctk.CTkToplevel(self)
-        dialog.title(title)
-        dialog.geometry("400x200")
-        dialog.resizable(False, False)
+        if self._error_dialog is None:
+            self._error_dialog = self._build_error_dialog()
+        self._error_dialog.title(title)
+        self._error_message.configure(text=message)
+        self._present_dialog(self._error_dialog)
 
-        # Block interaction with the main window
-        dialog.grab_set()
-        dialog.transient(self)
+        # Add to log
+        self._append_log(f"❌ ERROR: {message}")
+
+    def _build_error_dialog(self):
+        """Builds the error dialog; its title and message are set on show"""
+        colors = ProfessionalTheme.COLORS
+
+        dialog = self._create_dialog("Error", "400x200")
 
         # Main frame
         main_frame = ctk.CTkFrame(dialog)
@@ -551,135 +688,177 @@ class MainView(ctk.CTk, DownloadObserver):
         error_label = ctk.CTkLabel(
             main_frame,
             text="❌",
-            font=("Segoe UI", 36),
-            text_color=ProfessionalTheme.COLORS["error"],
+            font=self._fonts["icon36"],
+            text_color=colors["error"],
         )
         error_label.pack(pady=(10, 5))
 
         # Message
-        message_label = ctk.CTkLabel(
+        self._error_message = ctk.CTkLabel(
             main_frame,
-            text=message,
-            font=("Segoe UI", 12),
+            text="",
+            font=self._fonts["body12"],
             wraplength=350,
             justify="center",
         )
-        message_label.pack(pady=15, padx=10)
+        self._error_message.pack(pady=15, padx=10)
 
         # Accept button
         ok_btn = ctk.CTkButton(
             main_frame,
             text="Close",
-            command=dialog.destroy,
+            command=lambda: self._hide_dialog(dialog),
             width=120,
             height=32,
-            fg_color=ProfessionalTheme.COLORS["error"],
+            fg_color=colors["error"],
             hover_color="#D64A55",
         )
         ok_btn.pack(pady=10)
 
-        # Center dialog
-        WindowUtils.center(dialog)
-
-        # Add to log
-        self._append_log(f"❌ ERROR: {message}")
+        return dialog
 
     def _append_log(self, message):
-        """Adds a message to the activity log with a timestamp"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
+        """Queues a message for the activity log with a timestamp"""
+        t = time.localtime()
+        self._log_buffer.append(
+            f"[{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}] {message}\n"
+        )
+
+        # Coalesce all messages logged before the next idle tick into one write;
+        # entries logged before the log section exists wait for its creation
+        if not self._log_flush_scheduled and self.log_frame is not None:
+            self._log_flush_scheduled = True
+            self.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        """Writes all queued log entries to the activity log in a single insert"""
+        self._log_flush_scheduled = False
+        buffer, self._log_buffer = self._log_buffer, deque(maxlen=self.LOG_BUFFER_SIZE)
+        entries = "".join(buffer)
+
+        # Talk to the underlying Tk text widget directly; the CTk wrapper only
+        # adds Python-side bookkeeping around these calls
+        textbox = self.log_display._textbox
 
         # Enable editing, insert text, and disable editing again
-        self.log_display.configure(state="normal")
-        self.log_display.insert("end", log_entry)
-        self.log_display.see("end")  # Auto-scroll to the end
-        self.log_display.configure(state="disabled")
+        textbox.configure(state="normal")
+        textbox.insert("end", entries)
+
+        # Drop the oldest lines in one call once the log outgrows its cap
+        self._log_line_count += entries.count("\n")
+        excess = self._log_line_count - self.LOG_MAX_LINES
+        if excess > 0:
+            textbox.delete("1.0", f"{excess + 1}.0")
+            self._log_line_count -= excess
+
+        textbox.see("end")  # Auto-scroll to the end
+        textbox.configure(state="disabled")
 
     def _update_progress_ui(self, task):
         """Updates the progress UI with task information"""
         # Update status label
-        status_text = f"Status: {task.status} - {os.path.basename(task.url)}"
+        status_text = f"Status: {task.status} - {task.display_name}"
         self.status_label.configure(text=status_text)
 
         # Update progress bar
         progress_value = task.progress / 100.0
         self.progress_bar.set(progress_value)
 
-        # Update percentage label
-        self.progress_percent.configure(text=f"{int(task.progress)}%")
-
-        # Update progress bar color based on status
+        # Update percentage label (only when the whole percentage changed)
+        percent = int(task.progress)
+        if percent != self._shown_percent:
+            self.progress_percent.configure(text=f"{percent}%")
+            self._shown_percent = percent
+
+        # Update progress bar color based on status (only when the status changed)
+        if task.status == self._last_progress_color_status:
+            return
+        self._last_progress_color_status = task.status
+        colors = ProfessionalTheme.COLORS
         if task.status == "Error":
-            self.progress_bar.configure(
-                progress_color=ProfessionalTheme.COLORS["error"]
-            )
+            self.progress_bar.configure(progress_color=colors["error"])
         elif task.status == "Completed":
-            self.progress_bar.configure(
-                progress_color=ProfessionalTheme.COLORS["success"]
-            )
+            self.progress_bar.configure(progress_color=colors["success"])
         else:
-            self.progress_bar.configure(
-                progress_color=ProfessionalTheme.COLORS["accent"]
-            )
+            self.progress_bar.configure(progress_color=colors["accent"])
+
+    def _post(self, fn, *args):
+        """Schedules fn(*args) on the Tk thread; safe to call from any thread"""
+        # Downloads may outlive the window; their callbacks are then dropped
+        if self._closed:
+            return
+        try:
+            self.after(0, fn, *args)
+        except (RuntimeError, TclError):
+            pass  # Tk stopped or was destroyed after the check above
 
     def on_progress_update(self, task):
         """Updates the UI with download progress (Implementation of DownloadObserver)"""
+        # Called from download threads; widgets are only touched on the Tk thread
+        self._post(self._schedule_progress_update, task)
+
+    def _schedule_progress_update(self, task):
+        """Records the latest progress and schedules a coalesced redraw"""
         self.current_task = task
-        self._update_progress_ui(task)
+        self._pending_task = task
+
+        # Coalesce bursts of updates into one redraw per interval
+        if self._ui_flush_id is None:
+            self._ui_flush_id = self.after(
+                self.PROGRESS_UI_INTERVAL_MS, self._flush_progress
+            )
+
+    def _flush_progress(self):
+        """Redraws the progress UI with the latest pending task"""
+        self._ui_flush_id = None
+        self._update_progress_ui(self._pending_task)
 
     def on_task_complete(self, task):
         """Handles successful task completion (Implementation of DownloadObserver)"""
+        self._post(self._show_task_complete, task)
+
+    def _show_task_complete(self, task):
+        """Shows a completed task in the progress UI and the log"""
         self.current_task = task
         self._update_progress_ui(task)
-        self._append_log(f"✅ Download completed: {os.path.basename(task.url)}")
+        self._append_log(f"✅ Download completed: {task.display_name}")
 
     def on_task_error(self, task):
         """Handles errors in the download task (Implementation of DownloadObserver)"""
+        self._post(self._show_task_error, task)
+
+    def _show_task_error(self, task):
+        """Shows a failed task in the progress UI and the log"""
         self.current_task = task
         self._update_progress_ui(task)
         self._append_log(
-            f"❌ Download error: {os.path.basename(task.url)} - {task.error}"
+            f"❌ Download error: {task.display_name} - {task.error}"
         )
 
     def get_urls(self):
         """Gets the list of URLs from the text field"""
-        text_content = self.url_input.get("1.0", "end-1c").strip()
-        if not text_content:
-            return []
+        # Tk sets the modified flag on every edit, so an unset flag means the
+        # content is unchanged since the last read
+        if self._url_cache is not None and not self.url_input.edit_modified():
+            return self._url_cache
 
-        # Split by line breaks and filter empty lines
-        urls = [url.strip() for url in text_content.split("\n") if url.strip()]
-        return urls
+        # Extract stripped, non-empty lines in a single regex pass
+        self._url_cache = _URL_LINE_RE.findall(self.url_input.get("1.0", "end-1c"))
+        self.url_input.edit_modified(False)
+        return self._url_cache
 
     def get_format(self):
         """Gets the selected format in a suitable format for yt-dlp"""
-        format_map = {
-            "MP3 320kbps": "mp3",
-            "MP3 192kbps": "mp3",
-            "WAV": "wav",
-            "M4A": "m4a",
-            "OGG": "vorbis",
-        }
-
-        selected = self.format_selector.get()
-        return format_map.get(selected, "mp3")
+        return self._FORMAT_MAP.get(self.format_selector.get(), "mp3")
 
     def legal_accepted(self):
         """Checks if the user accepted the legal terms"""
         return self.legal_checkbox_var.get()
 
-    def mainloop(self):
-        """Starts the application's main loop"""
-        self.after(100, self._check_ffmpeg)  # Check dependencies after starting
-        super().mainloop()
-
-    def _check_ffmpeg(self):
-        """Checks the availability of FFmpeg at startup"""
-        # Already checked in the controller, this method is for future extensions
-        pass
-
     def _on_closing(self):
         """Handles the window closing event"""
+        colors = ProfessionalTheme.COLORS
+
         # Ask if there are downloads in progress
         if self.current_task and self.current_task.status == "Downloading":
             dialog = ctk.CTkToplevel(self)
@@ -695,15 +874,15 @@ class MainView(ctk.CTk, DownloadObserver):
             warning_label = ctk.CTkLabel(
                 main_frame,
                 text="⚠️",
-                font=("Segoe UI", 36),
-                text_color=ProfessionalTheme.COLORS["warning"],
+                font=self._fonts["icon36"],
+                text_color=colors["warning"],
             )
             warning_label.pack(pady=(10, 5))
 
             message_label = ctk.CTkLabel(
                 main_frame,
                 text="There are downloads in progress. Are you sure you want to exit?",
-                font=("Segoe UI", 12),
+                font=self._fonts["body12"],
                 wraplength=350,
                 justify="center",
             )
@@ -718,7 +897,7 @@ class MainView(ctk.CTk, DownloadObserver):
                 command=dialog.destroy,
                 width=120,
                 height=32,
-                fg_color=ProfessionalTheme.COLORS["foreground"],
+                fg_color=colors["foreground"],
                 hover_color="#333345",
             )
             cancel_btn.pack(side="left", padx=10, expand=True)
@@ -729,7 +908,7 @@ class MainView(ctk.CTk, DownloadObserver):
                 command=lambda: (dialog.destroy(), self.destroy()),
                 width=120,
                 height=32,
-                fg_color=ProfessionalTheme.COLORS["warning"],
+                fg_color=colors["warning"],
                 hover_color="#D69A57",
             )
             confirm_btn.pack(side="right", padx=10, expand=True)
@@ -741,5 +920,5 @@ class MainView(ctk.CTk, DownloadObserver):
 
     def destroy(self):
         """Overrides the destroy method to clean up resources"""
-        # Additional cleanup can be added here if necessary
+        self._closed = True  # Drop observer callbacks from download threads
         super().destroy()